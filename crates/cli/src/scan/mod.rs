@@ -713,11 +713,7 @@ maintainer = "RootCause Security Team <contact@rootcause.dev>"
     } else {
         AnalysisCache::default()
     };
-    let current_rules_hash = rules_fingerprint(&ruleset);
-    if cache.rules_hash() != Some(current_rules_hash.as_str()) {
-        cache.clear();
-    }
-    cache.set_rules_hash(current_rules_hash);
+    cache.set_rules_hash(rules_fingerprint(&ruleset));
     let mut cache_opt = if cache_path.is_some() {
         Some(&mut cache)
     } else {
@@ -48,7 +48,12 @@ impl AnalysisCache {
         self.rules_hash.as_deref()
     }
 
+    /// Records the fingerprint of the rule set in use, dropping every entry
+    /// computed under a different one.
     pub fn set_rules_hash(&mut self, hash: String) {
+        if self.rules_hash.as_deref() != Some(hash.as_str()) {
+            self.entries.clear();
+        }
         self.rules_hash = Some(hash);
     }
 }
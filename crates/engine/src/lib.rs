@@ -509,6 +509,41 @@ fn regex_ranges_any(source: &str, regs: &[AnyRegex]) -> Vec<(usize, usize)> {
     ranges
 }
 
+/// Longest word that every match of a text rule's `pattern` contains verbatim.
+///
+/// Returns `None` when the pattern may be a raw regex that could make its
+/// words optional. Metavariables (`$X`) are skipped, since they match
+/// arbitrary text.
+fn required_literal(pattern: &str) -> Option<&str> {
+    if pattern.contains(|c: char| {
+        matches!(
+            c,
+            '|' | '?' | '*' | '+' | '[' | ']' | '{' | '}' | '\\' | '~'
+        )
+    }) {
+        return None;
+    }
+    let is_word = |b: u8| b.is_ascii_alphanumeric() || b == b'_';
+    let bytes = pattern.as_bytes();
+    let mut best: Option<&str> = None;
+    let mut i = 0;
+    while i < bytes.len() {
+        if !is_word(bytes[i]) {
+            i += 1;
+            continue;
+        }
+        let start = i;
+        while i < bytes.len() && is_word(bytes[i]) {
+            i += 1;
+        }
+        let metavar = start > 0 && bytes[start - 1] == b'$';
+        if !metavar && best.map_or(true, |b| i - start > b.len()) {
+            best = Some(&pattern[start..i]);
+        }
+    }
+    best
+}
+
 fn line_col_at(source: &str, pos: usize) -> (usize, usize) {
     let pos = floor_char_boundary(source, pos);
     let mut line = 1usize;
@@ -1215,7 +1250,10 @@ fn eval_rule_impl(file: &FileIR, rule: &CompiledRule) -> Vec<Finding> {
         MatcherKind::TextRegex(re, orig) => {
             debug!(rule=%rule.id, file=%file.file_path, kind="TextRegex", fancy=re.is_fancy(), pat=%orig.chars().take(120).collect::<String>());
             let source = file.source.as_deref().unwrap_or("");
-            let mut findings: Vec<Finding> = source
+            // The line scan is skipped when the pattern's required word is absent.
+            let may_match = required_literal(orig).map_or(true, |lit| source.contains(lit));
+            let scanned = if may_match { source } else { "" };
+            let mut findings: Vec<Finding> = scanned
                 .lines()
                 .enumerate()
                 .filter_map(|(idx, line)| {
@@ -1316,8 +1354,13 @@ fn eval_rule_impl(file: &FileIR, rule: &CompiledRule) -> Vec<Finding> {
                         "Scanning fancy regex"
                     );
                 }
+                // A pattern whose required word is absent cannot match here, so
+                // its scan is skipped; the alias expansion below still runs.
+                let may_match = required_literal(orig).map_or(true, |lit| source.contains(lit));
                 // For fancy regexes (look-around), scan line by line to reduce catastrophic backtracking.
-                if re.is_fancy() {
+                if !may_match {
+                    debug!(rule = %rule.id, file = %file.file_path, idx, "Skipping pattern without its required literal");
+                } else if re.is_fancy() {
                     let start_guard = Instant::now();
                     let mut offset = 0usize;
                     for seg in source.split_inclusive('\n') {
@@ -3001,7 +3044,7 @@ fn jsonpath_findings(
 
 #[cfg(test)]
 mod tests {
-    use super::{derive_assignment_lhs, line_col_at};
+    use super::{derive_assignment_lhs, line_col_at, required_literal};
 
     #[test]
     fn derive_assignment_lhs_handles_non_char_boundary() {
@@ -3024,4 +3067,22 @@ $foo = 1; —
 
         assert_eq!(line_col_at(source, non_boundary), (2, 1));
     }
+
+    #[test]
+    fn required_literal_picks_longest_word() {
+        assert_eq!(
+            required_literal("subprocess.run(..., shell=True, ...)"),
+            Some("subprocess")
+        );
+        assert_eq!(required_literal("$X.execute($QUERY)"), Some("execute"));
+    }
+
+    #[test]
+    fn required_literal_rejects_regex_syntax() {
+        assert_eq!(required_literal("eval|exec"), None);
+        assert_eq!(required_literal(r"os\.system\("), None);
+        assert_eq!(required_literal("(?i)password"), None);
+        assert_eq!(required_literal("$X"), None);
+        assert_eq!(required_literal(""), None);
+    }
 }
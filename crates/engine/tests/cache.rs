@@ -127,3 +127,33 @@ fn rule_changes_invalidate_cache() {
     assert_eq!(second.len(), 2);
     assert_eq!(metrics.file_times_ms.len(), 1);
 }
+
+#[test]
+fn stale_rules_hash_is_not_reused() {
+    let cfg = EngineConfig::default();
+    let tmp = NamedTempFile::new().unwrap();
+    let path = tmp.path().to_path_buf();
+
+    let mut cache = AnalysisCache::load(&path);
+    let mut rules = sample_rules();
+    let first =
+        analyze_files_with_config(&[sample_file()], &rules, &cfg, Some(&mut cache), None, None);
+    assert_eq!(first.len(), 1);
+    cache.save(&path);
+
+    // No manual invalidation: the engine must notice the rule set changed.
+    let mut cache = AnalysisCache::load(&path);
+    rules.rules.push(extra_rule());
+    let mut metrics = EngineMetrics::default();
+    let second = analyze_files_with_config(
+        &[sample_file()],
+        &rules,
+        &cfg,
+        Some(&mut cache),
+        Some(&mut metrics),
+        None,
+    );
+    assert_eq!(second.len(), 2);
+    assert_eq!(metrics.file_times_ms.len(), 1);
+    assert_eq!(cache.rules_hash(), Some(rules_fingerprint(&rules).as_str()));
+}
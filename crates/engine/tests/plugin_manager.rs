@@ -4,7 +4,7 @@ use std::path::PathBuf;
 
 use base64::{engine::general_purpose, Engine as _};
 use engine::plugin::PluginManager;
-use plugin_core::FileSpec;
+use plugin_core::{FileSpec, RepoDiscoverParams};
 use serde_json::Value;
 use tempfile::TempDir;
 
@@ -523,3 +523,63 @@ timeout_ms = 5000
 
     let _ = fs::remove_file(file_path);
 }
+
+#[cfg(unix)]
+#[test]
+fn discover_skips_non_utf8_file_names() {
+    use std::ffi::OsStr;
+    use std::os::unix::ffi::OsStrExt;
+    use std::os::unix::fs::PermissionsExt;
+
+    let root = PathBuf::from(env!("CARGO_MANIFEST_DIR")).join("../..");
+    let py_src = root.join("examples/plugins/discover/polyglot-discover");
+    let tmp = TempDir::new().unwrap();
+    fs::copy(py_src.join("plugin.py"), tmp.path().join("plugin.py")).unwrap();
+    let mut perm = fs::metadata(tmp.path().join("plugin.py"))
+        .unwrap()
+        .permissions();
+    perm.set_mode(0o755);
+    fs::set_permissions(tmp.path().join("plugin.py"), perm).unwrap();
+    fs::write(
+        tmp.path().join("plugin.toml"),
+        r#"name = "polyglot-discover"
+version = "0.1.0"
+api_version = "1.x"
+entry = "python3 plugin.py"
+capabilities = ["discover"]
+needs_content = false
+reads_fs = true
+timeout_ms = 5000
+"#,
+    )
+    .unwrap();
+
+    // os.scandir hands the plugin lone surrogates for names that are not
+    // valid UTF-8; the reply must still encode and parse on the host.
+    let ws = TempDir::new().unwrap();
+    fs::write(ws.path().join("ok.py"), b"").unwrap();
+    fs::write(ws.path().join(OsStr::from_bytes(b"bad\xff.py")), b"").unwrap();
+
+    let pm = PluginManager::load(
+        &[tmp.path().to_path_buf()],
+        &HashMap::new(),
+        ws.path(),
+        &root,
+    )
+    .unwrap();
+    let discoverer = pm
+        .discoverers()
+        .iter()
+        .find(|p| p.name() == "polyglot-discover")
+        .expect("polyglot-discover loaded");
+
+    let res = discoverer
+        .discover(RepoDiscoverParams {
+            path: ".".into(),
+            extensions: vec![".py".into()],
+            max_depth: None,
+        })
+        .unwrap();
+    let paths: Vec<&str> = res.files.iter().map(|f| f.path.as_str()).collect();
+    assert_eq!(paths, vec!["ok.py"]);
+}
@@ -7,24 +7,101 @@ Features:
 - Reports external dependencies (package names) when possible
 - Emits basic metrics
 """
+import io
 import json
 import os
+import re
+import select
 import sys
 import time
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List
+
+# _dumps returns one newline-terminated JSON-RPC frame as bytes. The stdlib
+# encoder keeps ensure_ascii so lone surrogates (non-UTF-8 file names from
+# os.scandir) are sent as \u escapes instead of failing to encode.
+_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+
+def _dumps_std(obj: Any) -> bytes:
+    return (_encode(obj) + "\n").encode("ascii")
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # orjson rejects str that is not valid UTF-8
+            return _dumps_std(obj)
+
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback when orjson is not installed
+    _dumps = _dumps_std
+    _loads = json.loads
+
+# Replies are buffered and flushed whenever no further request is waiting on
+# stdin. Set PLUGIN_LINE_BUFFERED=1 to flush after every message instead.
+LINE_BUFFERED = os.getenv("PLUGIN_LINE_BUFFERED") == "1"
+_in_fd = sys.stdin.fileno()
+_out = io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "wb", closefd=False), buffer_size=1 << 20)
+
+
+def _write(frame: bytes) -> None:
+    _out.write(frame)
+    if LINE_BUFFERED:
+        _out.flush()
+
+
+def _stdin_pending() -> bool:
+    try:
+        return bool(select.select([_in_fd], [], [], 0)[0])
+    except (OSError, ValueError):  # e.g. no select() on this stream type
+        return False
+
+
+def read_requests() -> Iterator[bytes]:
+    """Yield request lines from stdin, flushing replies before it would block.
+
+    stdin is read in raw chunks rather than through a BufferedReader, whose
+    already-buffered lines select() cannot see: every request of a chunk is
+    answered first, then replies are flushed unless more input is waiting.
+    """
+    parts = []
+    try:
+        while True:
+            chunk = os.read(_in_fd, 1 << 16)
+            if not chunk:
+                break
+            parts.append(chunk)
+            if b"\n" not in chunk:
+                continue
+            lines = b"".join(parts).split(b"\n")
+            parts = [lines.pop()]
+            yield from lines
+            if not _stdin_pending():
+                _out.flush()
+        tail = b"".join(parts)
+        if tail:
+            yield tail
+    finally:
+        _out.flush()
+
+
+# `name = "..."` lines of Cargo.lock [[package]] tables
+CARGO_NAME_RE = re.compile(r'(?m)^name = "([^"]+)"')
 
 workspace_root = "."
 capabilities = ["discover"]
 
 
 def send(mid: str, result: Any = None, error: Dict[str, Any] | None = None) -> None:
-    msg = {"jsonrpc": "2.0", "id": mid}
     if error is None:
-        msg["result"] = result
+        msg = {"jsonrpc": "2.0", "id": mid, "result": result}
     else:
-        msg["error"] = error
-    sys.stdout.write(json.dumps(msg) + "\n")
-    sys.stdout.flush()
+        msg = {"jsonrpc": "2.0", "id": mid, "error": error}
+    _write(_dumps(msg))
 
 
 def log(level: str, message: str) -> None:
@@ -33,8 +110,7 @@ def log(level: str, message: str) -> None:
         "method": "plugin.log",
         "params": {"level": level, "message": message},
     }
-    sys.stdout.write(json.dumps(call) + "\n")
-    sys.stdout.flush()
+    _write(_dumps(call))
 
 
 def gather_external_deps(root: str, include_manifests: bool) -> List[Dict[str, Any]]:
@@ -50,26 +126,27 @@ def gather_external_deps(root: str, include_manifests: bool) -> List[Dict[str, A
                     external.append({"path": f"npm:{name}", "language": "javascript"})
         except Exception:
             pass
+    append = external.append
     # pip
     req = os.path.join(root, "requirements.txt")
     if os.path.isfile(req):
         try:
-            with open(req, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    name = line.strip().split("==")[0]
-                    if name:
-                        external.append({"path": f"pip:{name}", "language": "python"})
+            with open(req, "rb") as fh:
+                data = fh.read().decode("utf-8", "replace")
+            for line in data.splitlines():
+                name = line.strip().partition("==")[0]
+                if name:
+                    append({"path": f"pip:{name}", "language": "python"})
         except Exception:
             pass
     # cargo
     lock = os.path.join(root, "Cargo.lock")
     if os.path.isfile(lock):
         try:
-            with open(lock, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    if line.startswith("name = "):
-                        name = line.split("=", 1)[1].strip().strip('"')
-                        external.append({"path": f"cargo:{name}", "language": "rust"})
+            with open(lock, "rb") as fh:
+                data = fh.read().decode("utf-8", "replace")
+            for m in CARGO_NAME_RE.finditer(data):
+                append({"path": f"cargo:{m.group(1)}", "language": "rust"})
         except Exception:
             pass
 
@@ -81,39 +158,94 @@ def gather_external_deps(root: str, include_manifests: bool) -> List[Dict[str, A
     return external
 
 
-def discover_files(root: str, base: str, extensions: List[str], max_depth: int | None) -> List[Dict[str, Any]]:
+def _is_utf8(path: str) -> bool:
+    # Non-UTF-8 names come back from os.scandir with surrogate escapes; the
+    # host's FileSpec.path is a UTF-8 string, so such files cannot be reported.
+    try:
+        path.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _scan_dir(
+    dir_path: str, depth: int, max_depth: int | None, exts: tuple, root_prefix: str, files: List[Dict[str, Any]]
+) -> List[str]:
+    """Append matching files of one directory to ``files`` and return its subdirectories to visit."""
+    try:
+        with os.scandir(dir_path) as it:
+            entries = list(it)
+    except OSError:
+        return []
+    # If the directory is inside the workspace, every file in it is returned
+    # relative to the workspace; otherwise absolute. Decided once per directory.
+    dir_prefix = dir_path if dir_path.endswith(os.sep) else dir_path + os.sep
+    cut = len(root_prefix) if dir_prefix.startswith(root_prefix) else 0
+    descend = max_depth is None or depth < max_depth
+    append = files.append
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if descend and not entry.is_symlink():
+                subdirs.append(entry.path)
+            continue
+        if not exts or entry.name.lower().endswith(exts):
+            path = entry.path[cut:]
+            if path.isascii() or _is_utf8(path):
+                append({"path": path})
+    return subdirs
+
+
+def _walk_subtree(
+    dir_path: str, depth: int, max_depth: int | None, exts: tuple, root_prefix: str
+) -> List[Dict[str, Any]]:
     files: List[Dict[str, Any]] = []
+    # Explicit pre-order stack mirroring os.walk (no symlinked dirs followed),
+    # but reusing the DirEntry type info and never descending past max_depth.
+    stack = [(dir_path, depth)]
+    while stack:
+        path, level = stack.pop()
+        subdirs = _scan_dir(path, level, max_depth, exts, root_prefix, files)
+        stack.extend((sub, level + 1) for sub in reversed(subdirs))
+    return files
+
+
+def discover_files(root: str, base: str, extensions: List[str], max_depth: int | None) -> List[Dict[str, Any]]:
     # Normalize base: allow absolute or relative; compute rel paths against root
     start = base if os.path.isabs(base) else os.path.join(root, base)
     start = os.path.abspath(start)
     root_abs = os.path.abspath(root)
-    start_depth = len(os.path.abspath(start).split(os.sep))
-    for dirpath, _, filenames in os.walk(start):
-        if max_depth is not None:
-            depth = len(os.path.abspath(dirpath).split(os.sep)) - start_depth
-            if depth > max_depth:
-                continue
-        for name in filenames:
-            if not extensions or any(name.lower().endswith(ext.lower()) for ext in extensions):
-                full = os.path.abspath(os.path.join(dirpath, name))
-                # If file is inside workspace, return relative to workspace; otherwise absolute
-                try:
-                    common = os.path.commonpath([root_abs, full])
-                except Exception:
-                    common = None
-                if common == root_abs:
-                    rel = os.path.relpath(full, root_abs)
-                else:
-                    rel = full
-                files.append({"path": rel})
+    root_prefix = root_abs if root_abs.endswith(os.sep) else root_abs + os.sep
+    exts = tuple(ext.lower() for ext in extensions)
+    if max_depth == 0:
+        return _walk_subtree(start, 0, max_depth, exts, root_prefix)
+
+    files: List[Dict[str, Any]] = []
+    subdirs = _scan_dir(start, 0, max_depth, exts, root_prefix, files)
+    if len(subdirs) < 2:
+        for sub in subdirs:
+            files.extend(_walk_subtree(sub, 1, max_depth, exts, root_prefix))
+        return files
+    # readdir/stat release the GIL, so walking top-level subtrees in threads
+    # keeps several directory reads in flight when they miss the page cache;
+    # results are merged in submission order to keep os.walk order.
+    workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_walk_subtree, sub, 1, max_depth, exts, root_prefix) for sub in subdirs]
+        for future in futures:
+            files.extend(future.result())
     return files
 
 
 def main() -> None:
     global workspace_root
-    for line in sys.stdin:
+    for line in read_requests():
         try:
-            msg = json.loads(line)
+            msg = _loads(line)
         except Exception:
             continue
         mid = msg.get("id")
@@ -126,7 +258,7 @@ def main() -> None:
         elif method == "plugin.ping":
             send(mid, {"pong": True})
         elif method == "repo.discover":
-            t0 = time.time()
+            t0 = time.perf_counter_ns()
             base = params.get("path", ".")
             extensions = params.get("extensions", [])
             max_depth = params.get("max_depth")
@@ -134,7 +266,7 @@ def main() -> None:
 
             files = discover_files(workspace_root, base, extensions, max_depth)
             external = gather_external_deps(workspace_root, include_manifests)
-            elapsed = int((time.time() - t0) * 1000)
+            elapsed = (time.perf_counter_ns() - t0) // 1_000_000
             send(
                 mid,
                 {
@@ -3,13 +3,18 @@
 
 This plugin implements the report capability for RootCause.
 """
+import io
 import json
 import sys
 import os
+import select
 import signal
-import base64
+import binascii
+import mmap
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, List, Any, Iterator, Optional
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -17,19 +22,87 @@ from reportlab.lib.colors import HexColor, black, white, grey
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.lib import colors
 
+# _dumps returns one newline-terminated JSON-RPC frame as bytes.
+_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+
+def _dumps_std(obj):
+    return (_encode(obj) + "\n").encode("ascii")
+
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # stdlib fallback when orjson rejects the payload
+            return _dumps_std(obj)
+
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback when orjson is not installed
+    _dumps = _dumps_std
+    _loads = json.loads
+
+# Replies are buffered and flushed whenever no further request is waiting on
+# stdin. Set PLUGIN_LINE_BUFFERED=1 to flush after every message instead.
+LINE_BUFFERED = os.getenv("PLUGIN_LINE_BUFFERED") == "1"
+_in_fd = sys.stdin.fileno()
+_out = io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "wb", closefd=False), buffer_size=1 << 20)
+
+
+def _write(frame):
+    _out.write(frame)
+    if LINE_BUFFERED:
+        _out.flush()
+
+
+def _stdin_pending():
+    try:
+        return bool(select.select([_in_fd], [], [], 0)[0])
+    except (OSError, ValueError):  # e.g. no select() on this stream type
+        return False
+
+
+def read_requests():
+    """Yield request lines from stdin, flushing replies before it would block.
+
+    stdin is read in raw chunks rather than through a BufferedReader, whose
+    already-buffered lines select() cannot see: every request of a chunk is
+    answered first, then replies are flushed unless more input is waiting.
+    """
+    parts = []
+    try:
+        while True:
+            chunk = os.read(_in_fd, 1 << 16)
+            if not chunk:
+                break
+            parts.append(chunk)
+            if b"\n" not in chunk:
+                continue
+            lines = b"".join(parts).split(b"\n")
+            parts = [lines.pop()]
+            yield from lines
+            if not _stdin_pending():
+                _out.flush()
+        tail = b"".join(parts)
+        if tail:
+            yield tail
+    finally:
+        _out.flush()
+
 
 def send(msg_id, result=None, error=None):
     """Send a JSON-RPC message to stdout."""
-    payload = {"jsonrpc": "2.0", "id": msg_id}
     if error is None:
-        payload["result"] = result
+        payload = {"jsonrpc": "2.0", "id": msg_id, "result": result}
     else:
-        payload["error"] = error
+        payload = {"jsonrpc": "2.0", "id": msg_id, "error": error}
     try:
-        sys.stdout.write(json.dumps(payload) + "\n")
-        sys.stdout.flush()
+        _write(_dumps(payload))
     except BrokenPipeError:
         sys.exit(0)
 
@@ -45,8 +118,7 @@ def log(level, message):
         }
     }
     try:
-        sys.stdout.write(json.dumps(payload) + "\n")
-        sys.stdout.flush()
+        _write(_dumps(payload))
     except BrokenPipeError:
         sys.exit(0)
 
@@ -58,160 +130,215 @@ def handle_init(params):
     return {"ok": True, "capabilities": ["report"], "plugin_version": "1.0.0"}
 
 
+# Paragraph and table styles are built once and shared by every report.
+styles = getSampleStyleSheet()
+
+# Title style - using official brand colors
+TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=styles['Heading1'],
+    fontSize=28,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=HexColor('#151517')  # Brand text primary
+)
+
+# Subtitle style
+SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=styles['Heading2'],
+    fontSize=18,
+    spaceAfter=20,
+    textColor=HexColor('#53535A')  # Brand text secondary
+)
+
+# Body style
+BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=styles['Normal'],
+    fontSize=10,
+    spaceAfter=12,
+    textColor=HexColor('#151517')  # Brand text primary
+)
+
+# Code style - using brand colors
+CODE_STYLE = ParagraphStyle(
+    'CodeStyle',
+    parent=styles['Code'],
+    fontSize=9,
+    backColor=HexColor('#F6F7F9'),  # Brand surface
+    borderColor=HexColor('#E5E7EB'),  # Brand border
+    borderWidth=1,
+    leftIndent=10,
+    rightIndent=10,
+    spaceAfter=10,
+    textColor=HexColor('#151517')  # Brand text primary
+)
+
+# Brand accent style for highlights
+BRAND_STYLE = ParagraphStyle(
+    'BrandStyle',
+    parent=styles['Normal'],
+    fontSize=12,
+    spaceAfter=12,
+    textColor=HexColor('#FFD700'),  # Brand primary gold
+    fontName='Helvetica-Bold'
+)
+
+# Table styles are only read when applied, so one instance serves all tables
+SEVERITY_HEADER = ['Severity', 'Count', 'Percentage']
+SEVERITY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HexColor('#FFD700')),  # Brand primary gold
+    ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#151517')),  # Brand text primary
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), HexColor('#F6F7F9')),  # Brand surface
+    ('GRID', (0, 0), (-1, -1), 1, HexColor('#E5E7EB'))  # Brand border
+])
+
+DETAILS_HEADER = ['Property', 'Value']
+DETAILS_COL_WIDTHS = [1.5*inch, 4*inch]
+DETAILS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), HexColor('#FFD700')),  # Brand primary gold
+    ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#151517')),  # Brand text primary
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), HexColor('#F6F7F9')),  # Brand surface
+    ('GRID', (0, 0), (-1, -1), 1, HexColor('#E5E7EB')),  # Brand border
+    ('VALIGN', (0, 0), (-1, -1), 'TOP')
+])
+
+
+def display_path(file_path: str, workspace_root: str) -> str:
+    """Return the path shown for a finding's file."""
+    # Make path relative to workspace root if possible
+    if workspace_root and file_path.startswith(workspace_root):
+        return os.path.relpath(file_path, workspace_root)
+    if file_path != 'Unknown Path':
+        # If it's an absolute path, show just the filename
+        return os.path.basename(file_path)
+    return file_path
+
+
+# Flowables generated ahead of the layout position; comfortably more than a
+# keepWithNext chain can look ahead.
+STORY_LOOKAHEAD = 64
+
+
+class _LazyStory(list):
+    """Platypus story that is refilled from an iterator as it is consumed.
+
+    ``BaseDocTemplate.build`` checks ``len()`` before every flowable and
+    deletes flowables from the front once laid out, so only a short window of
+    the story exists at any time.
+    """
+
+    def __init__(self, flowables, lookahead=STORY_LOOKAHEAD):
+        super().__init__()
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+
+    def __len__(self):
+        size = super().__len__()
+        if self._source is not None and size < self._lookahead:
+            self.extend(islice(self._source, self._lookahead - size))
+            if super().__len__() < self._lookahead:
+                self._source = None
+            size = super().__len__()
+        return size
+
+
 def create_pdf_report(findings: List[Dict], metrics: Dict, output_path: str) -> str:
     """Create a professional PDF report from SAST findings."""
     doc = SimpleDocTemplate(output_path, pagesize=A4, 
                           rightMargin=72, leftMargin=72, 
                           topMargin=72, bottomMargin=18)
-    
-    # Define custom styles
-    styles = getSampleStyleSheet()
-    
-    # Title style - using official brand colors
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor=HexColor('#151517')  # Brand text primary
-    )
-    
-    # Subtitle style
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=18,
-        spaceAfter=20,
-        textColor=HexColor('#53535A')  # Brand text secondary
-    )
-    
-    # Body style
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=12,
-        textColor=HexColor('#151517')  # Brand text primary
-    )
-    
-    # Code style - using brand colors
-    code_style = ParagraphStyle(
-        'CodeStyle',
-        parent=styles['Code'],
-        fontSize=9,
-        backColor=HexColor('#F6F7F9'),  # Brand surface
-        borderColor=HexColor('#E5E7EB'),  # Brand border
-        borderWidth=1,
-        leftIndent=10,
-        rightIndent=10,
-        spaceAfter=10,
-        textColor=HexColor('#151517')  # Brand text primary
-    )
-    
-    # Brand accent style for highlights
-    brand_style = ParagraphStyle(
-        'BrandStyle',
-        parent=styles['Normal'],
-        fontSize=12,
-        spaceAfter=12,
-        textColor=HexColor('#FFD700'),  # Brand primary gold
-        fontName='Helvetica-Bold'
-    )
-    
-    # Build the story
-    story = []
-    
+    # The story is generated while Platypus lays it out instead of holding a
+    # Paragraph and Table for every finding before the first page is drawn.
+    doc.build(_LazyStory(report_story(findings, metrics)))
+    return output_path
+
+
+def report_story(findings: List[Dict], metrics: Dict) -> Iterator[Any]:
+    """Yield the flowables of the report in order."""
     # Title page with logo
     # Add logo if available
     logo_path = os.path.join(os.path.dirname(__file__), 'logo.png')
     if os.path.exists(logo_path):
         logo = Image(logo_path, width=120, height=120)
         logo.hAlign = 'CENTER'
-        story.append(logo)
-        story.append(Spacer(1, 20))
+        yield logo
+        yield Spacer(1, 20)
     
     # Main title
-    story.append(Paragraph("RootCause SAST Report", title_style))
-    story.append(Spacer(1, 10))
+    yield Paragraph("RootCause SAST Report", TITLE_STYLE)
+    yield Spacer(1, 10)
     
     # Subtitle with brand color
-    story.append(Paragraph("Static Application Security Testing", brand_style))
-    story.append(Spacer(1, 30))
+    yield Paragraph("Static Application Security Testing", BRAND_STYLE)
+    yield Spacer(1, 30)
     
     # Report metadata
     report_date = datetime.now().strftime("%B %d, %Y")
-    story.append(Paragraph(f"<b>Generated on:</b> {report_date}", body_style))
-    story.append(Paragraph(f"<b>Workspace:</b> {opts.get('workspace_root', 'N/A')}", body_style))
-    story.append(Spacer(1, 40))
+    yield Paragraph(f"<b>Generated on:</b> {report_date}", BODY_STYLE)
+    yield Paragraph(f"<b>Workspace:</b> {opts.get('workspace_root', 'N/A')}", BODY_STYLE)
+    yield Spacer(1, 40)
     
     # Executive Summary
-    story.append(Paragraph("Executive Summary", subtitle_style))
+    yield Paragraph("Executive Summary", SUBTITLE_STYLE)
     
     total_findings = len(findings)
-    severity_counts = {}
-    for finding in findings:
-        severity = finding.get('severity', 'unknown')
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
+    severity_counts = Counter(finding.get('severity', 'unknown') for finding in findings)
     
     summary_text = f"""
     This security analysis identified <b>{total_findings}</b> potential security issues across the codebase.
     The findings are distributed as follows:
     """
-    story.append(Paragraph(summary_text, body_style))
+    yield Paragraph(summary_text, BODY_STYLE)
     
     # Severity breakdown table
     if severity_counts:
-        severity_data = [['Severity', 'Count', 'Percentage']]
-        for severity, count in sorted(severity_counts.items()):
-            percentage = (count / total_findings * 100) if total_findings > 0 else 0
-            severity_data.append([severity.title(), str(count), f"{percentage:.1f}%"])
+        # Non-empty counts imply total_findings > 0
+        severity_data = [SEVERITY_HEADER]
+        severity_data.extend(
+            [severity.title(), str(count), f"{count / total_findings * 100:.1f}%"]
+            for severity, count in sorted(severity_counts.items())
+        )
         
         severity_table = Table(severity_data)
-        severity_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#FFD700')),  # Brand primary gold
-            ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#151517')),  # Brand text primary
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), HexColor('#F6F7F9')),  # Brand surface
-            ('GRID', (0, 0), (-1, -1), 1, HexColor('#E5E7EB'))  # Brand border
-        ]))
-        story.append(severity_table)
-        story.append(Spacer(1, 20))
+        severity_table.setStyle(SEVERITY_TABLE_STYLE)
+        yield severity_table
+        yield Spacer(1, 20)
     
     # Metrics
     if metrics:
-        story.append(Paragraph("Analysis Metrics", subtitle_style))
+        yield Paragraph("Analysis Metrics", SUBTITLE_STYLE)
         metrics_text = f"""
         <b>Total Issues Found:</b> {metrics.get('issues', total_findings)}<br/>
         <b>Analysis Time:</b> {metrics.get('ms', 0)}ms<br/>
         <b>Files Analyzed:</b> {metrics.get('files', 'N/A')}<br/>
         """
-        story.append(Paragraph(metrics_text, body_style))
-        story.append(Spacer(1, 20))
+        yield Paragraph(metrics_text, BODY_STYLE)
+        yield Spacer(1, 20)
     
-    story.append(PageBreak())
+    yield PageBreak()
     
     # Detailed Findings
-    story.append(Paragraph("Detailed Findings", subtitle_style))
+    yield Paragraph("Detailed Findings", SUBTITLE_STYLE)
     
     if not findings:
-        story.append(Paragraph("No security issues were found during the analysis.", body_style))
+        yield Paragraph("No security issues were found during the analysis.", BODY_STYLE)
     else:
+        workspace_root = opts.get('workspace_root', '')
         for i, finding in enumerate(findings, 1):
             # Finding header
             rule_id = finding.get('rule_id', 'Unknown Rule')
             severity = finding.get('severity', 'unknown')
-            file_path = finding.get('file', 'Unknown Path')
-            # Make path relative to workspace root if possible
-            workspace_root = opts.get('workspace_root', '')
-            if workspace_root and file_path.startswith(workspace_root):
-                file_path = os.path.relpath(file_path, workspace_root)
-            elif file_path != 'Unknown Path':
-                # If it's an absolute path, show just the filename
-                file_path = os.path.basename(file_path)
+            file_path = display_path(finding.get('file', 'Unknown Path'), workspace_root)
             
             line = finding.get('line', 'N/A')
             column = finding.get('column', 'N/A')
@@ -219,11 +346,11 @@ def create_pdf_report(findings: List[Dict], metrics: Dict, output_path: str) ->
             remediation = finding.get('remediation', '')
             
             finding_title = f"Finding #{i}: {rule_id}"
-            story.append(Paragraph(finding_title, subtitle_style))
+            yield Paragraph(finding_title, SUBTITLE_STYLE)
             
             # Finding details table
             details_data = [
-                ['Property', 'Value'],
+                DETAILS_HEADER,
                 ['Rule ID', rule_id],
                 ['Severity', severity.title()],
                 ['File Path', file_path],
@@ -240,45 +367,181 @@ def create_pdf_report(findings: List[Dict], metrics: Dict, output_path: str) ->
             if remediation:
                 details_data.append(['Remediation', remediation])
             
-            details_table = Table(details_data, colWidths=[1.5*inch, 4*inch])
-            details_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), HexColor('#FFD700')),  # Brand primary gold
-                ('TEXTCOLOR', (0, 0), (-1, 0), HexColor('#151517')),  # Brand text primary
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), HexColor('#F6F7F9')),  # Brand surface
-                ('GRID', (0, 0), (-1, -1), 1, HexColor('#E5E7EB')),  # Brand border
-                ('VALIGN', (0, 0), (-1, -1), 'TOP')
-            ]))
-            story.append(details_table)
+            details_table = Table(details_data, colWidths=DETAILS_COL_WIDTHS)
+            details_table.setStyle(DETAILS_TABLE_STYLE)
+            yield details_table
             
             # Additional context if available
             if 'context' in finding:
-                story.append(Spacer(1, 10))
-                story.append(Paragraph("Context:", body_style))
-                story.append(Paragraph(finding['context'], code_style))
+                yield Spacer(1, 10)
+                yield Paragraph("Context:", BODY_STYLE)
+                yield Paragraph(finding['context'], CODE_STYLE)
             
-            story.append(Spacer(1, 20))
+            yield Spacer(1, 20)
             
             # Add page break every 3 findings to avoid overcrowding
             if i % 3 == 0 and i < len(findings):
-                story.append(PageBreak())
+                yield PageBreak()
     
     # Footer
-    story.append(Spacer(1, 30))
-    story.append(Paragraph("Generated by RootCause SAST Plugin", brand_style))
-    story.append(Spacer(1, 10))
-    story.append(Paragraph("rootcause.sh", body_style))
-    
-    # Build PDF
-    doc.build(story)
+    yield Spacer(1, 30)
+    yield Paragraph("Generated by RootCause SAST Plugin", BRAND_STYLE)
+    yield Spacer(1, 10)
+    yield Paragraph("rootcause.sh", BODY_STYLE)
+
+
+# Fixed grid used by the canvas fast path (points)
+FAST_MARGIN = 72
+FAST_ROW_HEIGHT = 16
+FAST_FONT_SIZE = 9
+
+
+def fit_text(text, width, font='Helvetica', size=FAST_FONT_SIZE):
+    """Collapse ``text`` to one line, truncated with "..." to fit ``width``."""
+    text = " ".join(str(text).split())
+    full = stringWidth(text, font, size)
+    if full <= width:
+        return text
+    keep = int(len(text) * width / full)
+    while keep > 0 and stringWidth(text[:keep] + "...", font, size) > width:
+        keep -= 1
+    return text[:keep] + "..."
+
+
+def fast_canvas_report(findings: List[Dict], metrics: Dict, output_path: str) -> str:
+    """Draw a flat PDF report directly on a canvas, bypassing Platypus layout.
+
+    Every value is drawn on a single line of a fixed grid (long values are
+    truncated), which trades wrapping for far fewer calls per finding.
+    """
+    c = canvas.Canvas(output_path, pagesize=A4)
+    page_width, page_height = A4
+    left = FAST_MARGIN
+    label_width, value_width = DETAILS_COL_WIDTHS
+    top = page_height - FAST_MARGIN
+    bottom = FAST_MARGIN / 2
+    text_primary, text_secondary = HexColor('#151517'), HexColor('#53535A')
+    gold, surface, border = HexColor('#FFD700'), HexColor('#F6F7F9'), HexColor('#E5E7EB')
+    c.setLineWidth(1)
+    c.setStrokeColor(border)
+
+    def row(y, label, value, header=False):
+        c.setFillColor(gold if header else surface)
+        c.rect(left, y, label_width, FAST_ROW_HEIGHT, stroke=1, fill=1)
+        c.rect(left + label_width, y, value_width, FAST_ROW_HEIGHT, stroke=1, fill=1)
+        font = 'Helvetica-Bold' if header else 'Helvetica'
+        c.setFillColor(text_primary)
+        c.setFont(font, FAST_FONT_SIZE)
+        c.drawString(left + 4, y + 5, fit_text(label, label_width - 8, font))
+        c.drawString(left + label_width + 4, y + 5, fit_text(value, value_width - 8, font))
+
+    # Title page
+    y = top
+    logo_path = os.path.join(os.path.dirname(__file__), 'logo.png')
+    if os.path.exists(logo_path):
+        c.drawImage(logo_path, (page_width - 120) / 2, y - 120, width=120, height=120, mask='auto')
+        y -= 140
+    c.setFillColor(text_primary)
+    c.setFont('Helvetica-Bold', 28)
+    c.drawCentredString(page_width / 2, y - 28, "RootCause SAST Report")
+    c.setFillColor(gold)
+    c.setFont('Helvetica-Bold', 12)
+    c.drawCentredString(page_width / 2, y - 56, "Static Application Security Testing")
+    y -= 100
+    c.setFillColor(text_primary)
+    c.setFont('Helvetica', 10)
+    c.drawString(left, y, f"Generated on: {datetime.now().strftime('%B %d, %Y')}")
+    c.drawString(left, y - 14, fit_text(f"Workspace: {opts.get('workspace_root', 'N/A')}", label_width + value_width, size=10))
+    y -= 50
+
+    total_findings = len(findings)
+    severity_counts = Counter(finding.get('severity', 'unknown') for finding in findings)
+    c.setFillColor(text_secondary)
+    c.setFont('Helvetica-Bold', 18)
+    c.drawString(left, y, "Executive Summary")
+    c.setFillColor(text_primary)
+    c.setFont('Helvetica', 10)
+    c.drawString(left, y - 20, f"This security analysis identified {total_findings} potential security issues.")
+    y -= 50
+    if severity_counts:
+        row(y, SEVERITY_HEADER[0], f"{SEVERITY_HEADER[1]} / {SEVERITY_HEADER[2]}", header=True)
+        for severity, count in sorted(severity_counts.items()):
+            y -= FAST_ROW_HEIGHT
+            row(y, severity.title(), f"{count} / {count / total_findings * 100:.1f}%")
+        y -= 40
+    if metrics:
+        c.setFillColor(text_secondary)
+        c.setFont('Helvetica-Bold', 18)
+        c.drawString(left, y, "Analysis Metrics")
+        c.setFillColor(text_primary)
+        c.setFont('Helvetica', 10)
+        c.drawString(left, y - 20, f"Total Issues Found: {metrics.get('issues', total_findings)}")
+        c.drawString(left, y - 34, f"Analysis Time: {metrics.get('ms', 0)}ms")
+        c.drawString(left, y - 48, f"Files Analyzed: {metrics.get('files', 'N/A')}")
+    c.showPage()
+
+    # Detailed findings, packed onto pages of the fixed grid
+    c.setLineWidth(1)
+    c.setStrokeColor(border)
+    y = top
+    c.setFillColor(text_secondary)
+    c.setFont('Helvetica-Bold', 18)
+    c.drawString(left, y, "Detailed Findings")
+    y -= 36
+    if not findings:
+        c.setFillColor(text_primary)
+        c.setFont('Helvetica', 10)
+        c.drawString(left, y, "No security issues were found during the analysis.")
+    workspace_root = opts.get('workspace_root', '')
+    for i, finding in enumerate(findings, 1):
+        rule_id = finding.get('rule_id', 'Unknown Rule')
+        rows = [
+            ('Rule ID', rule_id),
+            ('Severity', finding.get('severity', 'unknown').title()),
+            ('File Path', display_path(finding.get('file', 'Unknown Path'), workspace_root)),
+            ('Line Number', finding.get('line', 'N/A')),
+            ('Column', finding.get('column', 'N/A')),
+            ('Message', finding.get('message', 'No message provided')),
+        ]
+        if finding.get('excerpt'):
+            rows.append(('Code Excerpt', finding['excerpt']))
+        if finding.get('remediation'):
+            rows.append(('Remediation', finding['remediation']))
+        if 'context' in finding:
+            rows.append(('Context', finding['context']))
+        block = 20 + FAST_ROW_HEIGHT * (len(rows) + 1)
+        if y - block < bottom:
+            c.showPage()
+            c.setLineWidth(1)
+            c.setStrokeColor(border)
+            y = top
+        c.setFillColor(text_secondary)
+        c.setFont('Helvetica-Bold', 12)
+        c.drawString(left, y, fit_text(f"Finding #{i}: {rule_id}", label_width + value_width, 'Helvetica-Bold', 12))
+        y -= 8 + FAST_ROW_HEIGHT
+        row(y, DETAILS_HEADER[0], DETAILS_HEADER[1], header=True)
+        for label, value in rows:
+            y -= FAST_ROW_HEIGHT
+            row(y, label, value)
+        y -= 28
+
+    # Footer
+    if y - 40 < bottom:
+        c.showPage()
+        y = top
+    c.setFillColor(gold)
+    c.setFont('Helvetica-Bold', 12)
+    c.drawString(left, y - 10, "Generated by RootCause SAST Plugin")
+    c.setFillColor(text_primary)
+    c.setFont('Helvetica', 10)
+    c.drawString(left, y - 28, "rootcause.sh")
+    c.save()
     return output_path
 
 
 def handle_report(params):
     """Handle report generation request."""
+    global _last_report_path
     try:
         findings = params.get("findings", [])
         metrics = params.get("metrics", {})
@@ -297,28 +560,30 @@ def handle_report(params):
         output_path = os.path.join(workspace_root, output_filename)
         log("info", f"Output path: {output_path}")
         
-        # Create the PDF report
-        pdf_path = create_pdf_report(findings, metrics, output_path)
-        
-        # Read the generated PDF and encode it
-        with open(pdf_path, 'rb') as f:
-            pdf_content = f.read()
-        
-        pdf_b64 = base64.b64encode(pdf_content).decode('utf-8')
+        # Create the PDF report; "fast" draws a flat layout straight on a canvas
+        # instead of laying out Platypus flowables
+        build_report = fast_canvas_report if opts.get("fast") else create_pdf_report
+        pdf_path = build_report(findings, metrics, output_path)
+        pdf_size = os.path.getsize(pdf_path)
+        _last_report_path = pdf_path
         
         # Log the output path BEFORE returning the result
         log("info", f"PDF report generated: {pdf_path}")
         
-        return {
+        result = {
             "report_path": pdf_path,
-            "report_content_b64": pdf_b64,
+            "report_size_bytes": pdf_size,
             "report_type": "application/pdf",
             "metrics": {
                 "findings_processed": len(findings),
-                "pdf_size_bytes": len(pdf_content),
+                "pdf_size_bytes": pdf_size,
                 "ms": 0
             }
         }
+        # Content is served through scan.report.read_chunk unless asked inline
+        if opts.get("inline_content"):
+            result["report_content_b64"] = encode_report(pdf_path)
+        return result
     except Exception as e:
         log("error", f"Failed to generate PDF report: {str(e)}")
         return {
@@ -327,6 +592,47 @@ def handle_report(params):
         }
 
 
+# Raw bytes per chunk; a multiple of 3 so chunks encode without padding.
+CHUNK_SIZE = 3 * 256 * 1024
+
+
+def encode_report(path, offset=0, length=None):
+    """Base64-encode ``length`` bytes of ``path`` from ``offset`` via mmap."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if length is None else min(size, offset + length)
+        if offset >= end:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return "".join(
+                binascii.b2a_base64(mm[pos:min(pos + CHUNK_SIZE, end)], newline=False).decode('ascii')
+                for pos in range(offset, end, CHUNK_SIZE)
+            )
+
+
+def handle_read_chunk(params):
+    """Return a base64 slice of the last generated report."""
+    pdf_path = _last_report_path
+    if not pdf_path or not os.path.isfile(pdf_path):
+        return {"error": "No report has been generated"}
+    try:
+        offset = max(0, int(params.get("offset", 0)))
+        length = max(0, int(params.get("length", CHUNK_SIZE)))
+        size = os.path.getsize(pdf_path)
+        content_b64 = encode_report(pdf_path, offset, length)
+        read = min(length, max(0, size - offset))
+        return {
+            "offset": offset,
+            "length": read,
+            "report_size_bytes": size,
+            "eof": offset + read >= size,
+            "content_b64": content_b64
+        }
+    except Exception as e:
+        log("error", f"Failed to read PDF report chunk: {str(e)}")
+        return {"error": f"Failed to read PDF report chunk: {str(e)}"}
+
+
 def signal_handler(signum, frame):
     """Handle signals for graceful termination."""
     sys.exit(0)
@@ -338,10 +644,12 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 opts = {"workspace_root": "", "output": "report.pdf"}
+# Set by scan.report only; kept out of opts, which init options can overwrite.
+_last_report_path = None
 
 try:
-    for line in sys.stdin:
-        msg = json.loads(line)
+    for line in read_requests():
+        msg = _loads(line)
         mid = msg.get("id")
         method = msg.get("method")
         params = msg.get("params", {})
@@ -350,6 +658,8 @@ try:
             send(mid, handle_init(params))
         elif method == "scan.report":
             send(mid, handle_report(params))
+        elif method == "scan.report.read_chunk":
+            send(mid, handle_read_chunk(params))
         elif method == "plugin.ping":
             send(mid, {"pong": True})
         elif method == "plugin.shutdown":
@@ -3,39 +3,172 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
 import os
+import pickle
+import select
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 from urllib import request, error
 
 import yaml
 
+# _dumps returns one newline-terminated JSON-RPC frame as bytes.
+_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+
+def _dumps_std(obj: Any) -> bytes:
+    return (_encode(obj) + "\n").encode("ascii")
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # stdlib fallback when orjson rejects the payload
+            return _dumps_std(obj)
+
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback when orjson is not installed
+    _dumps = _dumps_std
+    _loads = json.loads
+
+# Replies are buffered and flushed whenever no further request is waiting on
+# stdin. Set PLUGIN_LINE_BUFFERED=1 to flush after every message instead.
+LINE_BUFFERED = os.getenv("PLUGIN_LINE_BUFFERED") == "1"
+_in_fd = sys.stdin.fileno()
+_out = io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "wb", closefd=False), buffer_size=1 << 20)
+
+
+def _write(frame: bytes) -> None:
+    _out.write(frame)
+    if LINE_BUFFERED:
+        _out.flush()
+
+
+def _stdin_pending() -> bool:
+    try:
+        return bool(select.select([_in_fd], [], [], 0)[0])
+    except (OSError, ValueError):  # e.g. no select() on this stream type
+        return False
+
+
+def read_requests() -> Iterator[bytes]:
+    """Yield request lines from stdin, flushing replies before it would block.
+
+    stdin is read in raw chunks rather than through a BufferedReader, whose
+    already-buffered lines select() cannot see: every request of a chunk is
+    answered first, then replies are flushed unless more input is waiting.
+    """
+    parts = []
+    try:
+        while True:
+            chunk = os.read(_in_fd, 1 << 16)
+            if not chunk:
+                break
+            parts.append(chunk)
+            if b"\n" not in chunk:
+                continue
+            lines = b"".join(parts).split(b"\n")
+            parts = [lines.pop()]
+            yield from lines
+            if not _stdin_pending():
+                _out.flush()
+        tail = b"".join(parts)
+        if tail:
+            yield tail
+    finally:
+        _out.flush()
+
+
+try:
+    import simdjson
+
+    # Reused across fetches; proxies must not outlive the next parse.
+    _json_parser = simdjson.Parser()
+except ImportError:  # stdlib fallback when pysimdjson is not installed
+    simdjson = None
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+rules_dir = os.path.join(os.path.dirname(__file__), "rules")
+
+# Parsed rule files are cached between runs, keyed by (mtime_ns, size). Each
+# rules directory gets its own cache file so that checkouts sharing a cache
+# home do not overwrite each other's entries.
+CACHE_PATH = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "rootcause",
+    "dynamic-rules-demo",
+    "rules-%s.pkl" % hashlib.sha256(os.fsencode(os.path.abspath(rules_dir))).hexdigest()[:16],
+)
+
+
+def _read_cache() -> Dict[str, Tuple[int, int, Any]]:
+    try:
+        with open(CACHE_PATH, "rb") as fh:
+            cache = pickle.load(fh)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_cache(cache: Dict[str, Tuple[int, int, Any]]) -> None:
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        tmp = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fh:
+            pickle.dump(cache, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, CACHE_PATH)
+    except Exception as e:
+        print(f"[dynamic-rules-demo] Failed to write rules cache: {e}", file=sys.stderr)
+
 
 # Load all rule definitions once at startup.
 RULES: Dict[str, Dict[str, Any]] = {}
-rules_dir = os.path.join(os.path.dirname(__file__), "rules")
-for name in os.listdir(rules_dir):
-    if not name.endswith((".yaml", ".yml")):
+_cache = _read_cache()
+_fresh: Dict[str, Tuple[int, int, Any]] = {}
+RULE_SUFFIXES = (".yaml", ".yml")
+with os.scandir(rules_dir) as it:
+    rule_entries = [e for e in it if e.name.endswith(RULE_SUFFIXES) and e.is_file(follow_symlinks=False)]
+for entry in rule_entries:
+    path = os.path.abspath(entry.path)
+    st = entry.stat(follow_symlinks=False)
+    if not st.st_size:
         continue
-    with open(os.path.join(rules_dir, name), "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
-        for rule in data.get("rules", []):
-            rid = rule.get("id")
-            if rid:
-                RULES[rid] = rule
+    hit = _cache.get(path)
+    # Entries of any other shape (older formats, corruption) count as misses.
+    if isinstance(hit, tuple) and len(hit) == 3 and hit[:2] == (st.st_mtime_ns, st.st_size):
+        data = hit[2]
+    else:
+        # libyaml parses a single bytes buffer faster than a text stream.
+        with open(path, "rb") as fh:
+            data = yaml.load(fh.read(), Loader=Loader) or {}
+    _fresh[path] = (st.st_mtime_ns, st.st_size, data)
+    for rule in data.get("rules", []):
+        rid = rule.get("id")
+        if rid:
+            RULES[rid] = rule
+if _fresh != _cache:
+    _write_cache(_fresh)
+del _cache, _fresh, rule_entries
 
 
 def send(mid: Any, result: Any | None = None, error: Dict[str, Any] | None = None) -> None:
     """Send a JSON-RPC message to stdout."""
 
-    msg: Dict[str, Any] = {"jsonrpc": "2.0", "id": mid}
     if error is None:
-        msg["result"] = result
+        msg: Dict[str, Any] = {"jsonrpc": "2.0", "id": mid, "result": result}
     else:
-        msg["error"] = error
-    sys.stdout.write(json.dumps(msg) + "\n")
-    sys.stdout.flush()
+        msg = {"jsonrpc": "2.0", "id": mid, "error": error}
+    _write(_dumps(msg))
 
 
 def _write_yaml_rules(filename: str, rules: list[dict[str, Any]]) -> None:
@@ -43,7 +176,7 @@ def _write_yaml_rules(filename: str, rules: list[dict[str, Any]]) -> None:
         os.makedirs(rules_dir, exist_ok=True)
         path = os.path.join(rules_dir, filename)
         with open(path, "w", encoding="utf-8") as fh:
-            yaml.safe_dump({"rules": rules}, fh, sort_keys=False)
+            yaml.dump({"rules": rules}, fh, Dumper=Dumper, sort_keys=False)
         print(f"[dynamic-rules-demo] Wrote {len(rules)} rules to {path}", file=sys.stderr)
     except Exception as e:
         print(f"[dynamic-rules-demo] Failed to write rules file: {e}", file=sys.stderr)
@@ -55,8 +188,10 @@ def _fetch_json(url: str) -> Any | None:
             if resp.status != 200:
                 print(f"[dynamic-rules-demo] HTTP {resp.status} fetching {url}", file=sys.stderr)
                 return None
-            data = resp.read().decode("utf-8", errors="replace")
-            return json.loads(data)
+            data = resp.read()
+            if simdjson is None:
+                return _loads(data)
+            return _materialize(_json_parser.parse(data))
     except error.URLError as e:
         print(f"[dynamic-rules-demo] URL error fetching {url}: {e}", file=sys.stderr)
     except Exception as e:
@@ -64,6 +199,26 @@ def _fetch_json(url: str) -> Any | None:
     return None
 
 
+def _materialize(doc: Any) -> Any:
+    """Copy the parts of a simdjson document we read into plain Python objects."""
+
+    if isinstance(doc, simdjson.Array):
+        return doc.as_list()
+    if isinstance(doc, simdjson.Object):
+        out: Dict[str, Any] = {}
+        # Only the top-level keys consumed by _rules_from_payload are built.
+        for key in ("rules", "banned_tokens"):
+            value = doc.get(key)
+            if isinstance(value, simdjson.Array):
+                out[key] = value.as_list()
+            elif isinstance(value, simdjson.Object):
+                out[key] = value.as_dict()
+            elif value is not None:
+                out[key] = value
+        return out
+    return doc
+
+
 def _rules_from_payload(payload: Any) -> list[dict[str, Any]]:
     # Accepted shapes:
     # 1) {"rules": [{id,message,severity,pattern(s)}]}
@@ -113,9 +268,9 @@ def _rules_from_payload(payload: Any) -> list[dict[str, Any]]:
     return rules
 
 
-for line in sys.stdin:
+for line in read_requests():
     try:
-        req = json.loads(line)
+        req = _loads(line)
     except Exception:
         continue
 
@@ -4,31 +4,232 @@
 This plugin implements the transform capability for RootCause.
 """
 import base64
+import binascii
+import io
 import json
+import mmap
 import re
 import sys
 import os
+import select
 import signal
 
+# _dumps returns one newline-terminated JSON-RPC frame as bytes.
+_encode = json.JSONEncoder(separators=(",", ":"), check_circular=False).encode
+
+
+def _dumps_std(obj):
+    return (_encode(obj) + "\n").encode("ascii")
+
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:  # stdlib fallback when orjson rejects the payload
+            return _dumps_std(obj)
+
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback when orjson is not installed
+    _dumps = _dumps_std
+    _loads = json.loads
+
+# Replies are buffered and flushed whenever no further request is waiting on
+# stdin. Set PLUGIN_LINE_BUFFERED=1 to flush after every message instead.
+LINE_BUFFERED = os.getenv("PLUGIN_LINE_BUFFERED") == "1"
+_in_fd = sys.stdin.fileno()
+_out = io.BufferedWriter(io.FileIO(sys.stdout.fileno(), "wb", closefd=False), buffer_size=1 << 20)
+
+
+def _write(frame):
+    _out.write(frame)
+    if LINE_BUFFERED:
+        _out.flush()
+
+
+def _stdin_pending():
+    try:
+        return bool(select.select([_in_fd], [], [], 0)[0])
+    except (OSError, ValueError):  # e.g. no select() on this stream type
+        return False
+
+
+def read_requests():
+    """Yield request lines from stdin, flushing replies before it would block.
+
+    stdin is read in raw chunks rather than through a BufferedReader, whose
+    already-buffered lines select() cannot see: every request of a chunk is
+    answered first, then replies are flushed unless more input is waiting.
+    """
+    parts = []
+    try:
+        while True:
+            chunk = os.read(_in_fd, 1 << 16)
+            if not chunk:
+                break
+            parts.append(chunk)
+            if b"\n" not in chunk:
+                continue
+            lines = b"".join(parts).split(b"\n")
+            parts = [lines.pop()]
+            yield from lines
+            if not _stdin_pending():
+                _out.flush()
+        tail = b"".join(parts)
+        if tail:
+            yield tail
+    finally:
+        _out.flush()
+
+
+try:
+    import hyperscan
+except ImportError:  # optional prefilter; the re engine is used on its own
+    hyperscan = None
+
+try:
+    import numpy as np
+except ImportError:  # optional vectorised scan; the re engine is used instead
+    np = None
+
+# Lookup table marking the base64 alphabet (padding is handled separately).
+B64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+if np is not None:
+    _B64_TABLE = np.zeros(256, dtype=np.bool_)
+    _B64_TABLE[np.frombuffer(B64_ALPHABET, dtype=np.uint8)] = True
+
 
 def send(msg_id, result=None, error=None):
     """Send a JSON-RPC message to stdout."""
-    payload = {"jsonrpc": "2.0", "id": msg_id}
     if error is None:
-        payload["result"] = result
+        payload = {"jsonrpc": "2.0", "id": msg_id, "result": result}
     else:
-        payload["error"] = error
+        payload = {"jsonrpc": "2.0", "id": msg_id, "error": error}
     try:
-        sys.stdout.write(json.dumps(payload) + "\n")
-        sys.stdout.flush()
+        _write(_dumps(payload))
     except BrokenPipeError:
         # Parent process ended; exit quietly
         sys.exit(0)
 
 
+def compile_matchers():
+    """Compile the base64 block matchers for the configured ``min_len``."""
+    pattern = rb"[A-Za-z0-9+/]{%d,}={0,2}" % int(opts["min_len"])
+    opts["_b64_re"] = re.compile(pattern)
+    opts["_hs_db"] = None
+    if hyperscan is not None:
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[pattern],
+                ids=[0],
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH],
+            )
+            opts["_hs_db"] = db
+        except Exception:
+            opts["_hs_db"] = None
+
+
+def find_blocks(raw):
+    """Return the base64 candidate blocks found in ``raw``."""
+    db = opts.get("_hs_db")
+    if db is not None:
+        # Hyperscan only answers "is there any block?"; reporting every match
+        # end through a Python callback would cost more than the re scan.
+        hit = []
+        db.scan(raw, match_event_handler=lambda *_: hit.append(True))
+        if not hit:
+            return []
+    if np is not None:
+        return _find_blocks_np(raw, int(opts["min_len"]))
+    return opts["_b64_re"].findall(raw)
+
+
+# Bytes classified per numpy pass, so the temporary arrays stay bounded even
+# for large memory-mapped inputs.
+NP_WINDOW = 1 << 22
+
+
+def _find_blocks_np(raw, min_len):
+    """Vectorised equivalent of ``[A-Za-z0-9+/]{min_len,}={0,2}`` findall."""
+    size = len(raw)
+    if size < min_len:
+        return []
+    view = memoryview(raw)
+    found = []
+    carry = None  # start of a run that reaches the end of the previous window
+    for lo in range(0, size, NP_WINDOW):
+        hi = min(lo + NP_WINDOW, size)
+        edges = np.zeros(hi - lo + 2, dtype=np.int8)
+        edges[0] = carry is not None
+        edges[1:-1] = _B64_TABLE[np.frombuffer(raw, dtype=np.uint8, count=hi - lo, offset=lo)]
+        edges = np.diff(edges)
+        starts = (np.flatnonzero(edges == 1) + lo).tolist()
+        ends = (np.flatnonzero(edges == -1) + lo).tolist()
+        if carry is not None:
+            starts.insert(0, carry)
+            carry = None
+        if hi < size and ends and ends[-1] == hi:
+            # The last run may continue into the next window.
+            ends.pop()
+            carry = starts.pop()
+        for start, end in zip(starts, ends):
+            if end - start < min_len:
+                continue
+            # Absorb up to two trailing padding characters, like the regex does.
+            for _ in range(2):
+                if end < size and raw[end] == 61:  # ord("=")
+                    end += 1
+            found.append(view[start:end])
+    return found
+
+
+def decode_blocks(found):
+    """Decode base64 blocks and return the concatenated bytes."""
+    # One decode over the concatenation equals per-block decoding as long as
+    # every block but the last is a whole number of unpadded quads.
+    if all(len(b) % 4 == 0 and b[-1] != 61 for b in found[:-1]):
+        return binascii.a2b_base64(b"".join(found))
+    return b"".join(binascii.a2b_base64(b) for b in found)
+
+
+# Files at least this large are memory-mapped rather than read into memory.
+MMAP_MIN_SIZE = 1 << 20
+
+
+def read_input(full):
+    """Return the contents of ``full``, as an mmap when the file is large."""
+    with open(full, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size < MMAP_MIN_SIZE:
+            return fh.read()
+        # The mapping keeps its own handle, so the file can be closed here.
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def transform_content(path, raw):
+    """Return the transform result for one file's contents."""
+    found = find_blocks(raw)
+    if not found:
+        return {"path": path, "actions": []}
+    try:
+        joined = decode_blocks(found)
+    except Exception:
+        return {"path": path, "actions": []}
+    # The blocks may be views into a mapping; only decoded bytes escape.
+    return {
+        "path": path,
+        "actions": ["decoded:base64"],
+        "content_b64": base64.b64encode(joined).decode(),
+        "notes": [f"blocks:{len(found)}"],
+    }
+
+
 def handle_init(params):
     opts.update(params.get("options") or {})
     opts["workspace_root"] = params.get("workspace_root", "")
+    compile_matchers()
     return {"ok": True, "capabilities": ["transform"], "plugin_version": "1.0.0"}
 
 
@@ -42,31 +243,21 @@ def handle_transform(params):
             except Exception:
                 out.append({"path": path, "actions": []})
                 continue
+            result = transform_content(path, raw)
         else:
             try:
-                full = os.path.join(opts.get("workspace_root", ""), path)
-                with open(full, "rb") as fh:
-                    raw = fh.read()
+                raw = read_input(os.path.join(opts.get("workspace_root", ""), path))
             except Exception:
                 out.append({"path": path, "actions": []})
                 continue
-        found = re.findall(rb"[A-Za-z0-9+/]{%d,}={0,2}" % int(opts["min_len"]), raw)
-        if not found:
-            out.append({"path": path, "actions": []})
-            continue
-        try:
-            joined = b"".join(base64.b64decode(b) for b in found)
-            out.append(
-                {
-                    "path": path,
-                    "actions": ["decoded:base64"],
-                    "content_b64": base64.b64encode(joined).decode(),
-                    "notes": [f"blocks:{len(found)}"],
-                }
-            )
+            try:
+                result = transform_content(path, raw)
+            finally:
+                if isinstance(raw, mmap.mmap):
+                    raw.close()
+        if "content_b64" in result:
             decoded += 1
-        except Exception:
-            out.append({"path": path, "actions": []})
+        out.append(result)
     return {"files": out, "metrics": {"decoded": decoded, "ms": 0}}
 
 
@@ -80,9 +271,10 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 opts = {"mode": "safe", "min_len": 64}
+compile_matchers()
 try:
-    for line in sys.stdin:
-        msg = json.loads(line)
+    for line in read_requests():
+        msg = _loads(line)
         mid = msg.get("id")
         method = msg.get("method")
         params = msg.get("params", {})